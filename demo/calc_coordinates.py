@@ -1,59 +1,56 @@
-class Element:
-    def __init__(self, x, y, width, height):
-        self.location = {"x": x, "y": y}
-        self.size = {"width": width, "height": height}
+import sys
+from typing import NamedTuple
 
+TEMPLATE = (
+    "Top-Left-Point:  {}\n"
+    "Top-Mid-Point:  {}\n"
+    "Top-Right-Point:  {}\n"
+    "\n"
+    "Left-Mid-Point:  {}\n"
+    "Mid-Point:  {}\n"
+    "Right-Mid-Point:  {}\n"
+    "\n"
+    "Bottom-Left-Point:  {}\n"
+    "Bottom-Mid-Point:  {}\n"
+    "Bottom-Right-Point:  {}\n"
+)
 
-def calculate_coordinates():
-    element = Element(20, 20, 40, 20)
 
-    top_left_point = element.location["x"], element.location["y"]
-    top_mid_point = (
-        element.location["x"] + (element.size["width"] // 2),
-        element.location["y"],
-    )
-    top_right_point = (
-        element.location["x"] + element.size["width"],
-        element.location["y"],
-    )
+class Element(NamedTuple):
+    x: int
+    y: int
+    w: int
+    h: int
 
-    left_mid_point = (
-        element.location["x"],
-        element.location["y"] + (element.size["height"] // 2),
-    )
-    mid_point = (
-        element.location["x"] + (element.size["width"] // 2),
-        element.location["y"] + (element.size["height"] // 2),
-    )
-    right_mid_point = (
-        element.location["x"] + element.size["width"],
-        element.location["y"] + (element.size["height"] // 2),
-    )
 
-    bottom_left_point = (
-        element.location["x"],
-        element.location["y"] + element.size["height"],
-    )
-    bottom_mid_point = (
-        element.location["x"] + (element.size["width"] // 2),
-        element.location["y"] + element.size["height"],
-    )
-    bottom_right_point = (
-        element.location["x"] + element.size["width"],
-        element.location["y"] + element.size["height"],
-    )
+def compute_anchor_grid(x, y, w, h):
+    xs = (x, x + w // 2, x + w)
+    ys = (y, y + h // 2, y + h)
+    return [[(px, py) for px in xs] for py in ys]
 
-    print("Top-Left-Point: ", top_left_point)
-    print("Top-Mid-Point: ", top_mid_point)
-    print("Top-Right-Point: ", top_right_point)
-    print()
-    print("Left-Mid-Point: ", left_mid_point)
-    print("Mid-Point: ", mid_point)
-    print("Right-Mid-Point: ", right_mid_point)
-    print()
-    print("Bottom-Left-Point: ", bottom_left_point)
-    print("Bottom-Mid-Point: ", bottom_mid_point)
-    print("Bottom-Right-Point: ", bottom_right_point)
+
+def calculate_coordinates():
+    element = Element(20, 20, 40, 20)
+
+    (
+        (top_left_point, top_mid_point, top_right_point),
+        (left_mid_point, mid_point, right_mid_point),
+        (bottom_left_point, bottom_mid_point, bottom_right_point),
+    ) = compute_anchor_grid(*element)
+
+    sys.stdout.write(
+        TEMPLATE.format(
+            top_left_point,
+            top_mid_point,
+            top_right_point,
+            left_mid_point,
+            mid_point,
+            right_mid_point,
+            bottom_left_point,
+            bottom_mid_point,
+            bottom_right_point,
+        )
+    )
 
 
 if __name__ == "__main__":
@@ -1,51 +1,95 @@
 """
 This package provides enhanced gesture functionality in Appium.
+
+Public names are resolved lazily on first access, so importing the package
+does not load the Appium and Selenium client modules until they are needed.
 """
 
-from .actions import GestureActions
-from .calculations import (
-    calculate_boundaries_and_scrollable_area,
-    calculate_element_points,
-    retrieve_element_location,
-    retrieve_viewport_dimensions,
-)
-from .drag_and_drop import DragAndDropGestures
-from .enums import (
-    Direction,
-    SeekDirection,
-    UiSelector,
-)
-from .exceptions import (
-    DragDropError,
-    ElementInteractionError,
-    ElementNotInViewError,
-    GestureError,
-    InvalidGestureError,
-    SwipeError,
-    ViewportError,
-    ZoomError,
-)
-from .pinch import PinchGestures
-from .swipe import SwipeGestures
-
-__all__ = [
-    "GestureActions",
-    "DragAndDropGestures",
-    "PinchGestures",
-    "SwipeGestures",
-    "calculate_boundaries_and_scrollable_area",
-    "calculate_element_points",
-    "retrieve_element_location",
-    "retrieve_viewport_dimensions",
-    "Direction",
-    "SeekDirection",
-    "UiSelector",
-    "GestureError",
-    "DragDropError",
-    "ElementInteractionError",
-    "ElementNotInViewError",
-    "InvalidGestureError",
-    "SwipeError",
-    "ViewportError",
-    "ZoomError",
-]
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .actions import GestureActions
+    from .calculations import (
+        Boundaries,
+        PointGrid,
+        ScrollableArea,
+        calculate_boundaries,
+        calculate_boundaries_and_scrollable_area,
+        calculate_element_grid,
+        calculate_element_midpoint,
+        calculate_element_points,
+        element_rect_cache,
+        invalidate_element_rect_cache,
+        invalidate_viewport_cache,
+        retrieve_display_density,
+        retrieve_element_location,
+        retrieve_viewport_dimensions,
+    )
+    from .drag_and_drop import DragAndDropGestures
+    from .enums import Anchor, Direction, SeekDirection, UiSelector
+    from .exceptions import (
+        DragDropError,
+        ElementInteractionError,
+        ElementNotInViewError,
+        GestureError,
+        InvalidGestureError,
+        SwipeError,
+        ViewportError,
+        ZoomError,
+    )
+    from .pinch import PinchGestures
+    from .swipe import SwipeGestures
+
+_LAZY = {
+    "GestureActions": "actions",
+    "DragAndDropGestures": "drag_and_drop",
+    "PinchGestures": "pinch",
+    "SwipeGestures": "swipe",
+    "Boundaries": "calculations",
+    "PointGrid": "calculations",
+    "ScrollableArea": "calculations",
+    "calculate_boundaries": "calculations",
+    "calculate_boundaries_and_scrollable_area": "calculations",
+    "calculate_element_grid": "calculations",
+    "calculate_element_midpoint": "calculations",
+    "calculate_element_points": "calculations",
+    "element_rect_cache": "calculations",
+    "invalidate_element_rect_cache": "calculations",
+    "invalidate_viewport_cache": "calculations",
+    "retrieve_display_density": "calculations",
+    "retrieve_element_location": "calculations",
+    "retrieve_viewport_dimensions": "calculations",
+    "Anchor": "enums",
+    "Direction": "enums",
+    "SeekDirection": "enums",
+    "UiSelector": "enums",
+    "GestureError": "exceptions",
+    "DragDropError": "exceptions",
+    "ElementInteractionError": "exceptions",
+    "ElementNotInViewError": "exceptions",
+    "InvalidGestureError": "exceptions",
+    "SwipeError": "exceptions",
+    "ViewportError": "exceptions",
+    "ZoomError": "exceptions",
+}
+
+__all__ = tuple(_LAZY)
+
+
+def __getattr__(name: str) -> object:
+    """Import and cache a public name from its submodule on first access."""
+    try:
+        module = _LAZY[name]
+    except KeyError:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg) from None
+
+    obj = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = obj
+    return obj
+
+
+def __dir__() -> list[str]:
+    """List the public names without resolving any of them."""
+    return list(__all__)
@@ -1,54 +1,147 @@
 import logging
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import NamedTuple
 
 from appium.webdriver.webdriver import WebDriver
 from appium.webdriver.webelement import WebElement
 from selenium.common.exceptions import (
     NoSuchElementException,
     TimeoutException,
+    UnknownMethodException,
     WebDriverException,
 )
 
+from .enums import Anchor
 from .exceptions import ViewportError
 
 logger = logging.getLogger(__name__)
 
+# Element rects remembered by `element_rect_cache`, local to the current thread or task
+_rect_cache: ContextVar[dict[str, tuple[int, int, int, int]] | None] = ContextVar(
+    "_rect_cache", default=None
+)
+_viewport_cache: dict[str, tuple[int, int]] = {}
+_density_cache: dict[str, int] = {}
+
+
+class Boundaries(NamedTuple):
+    """The upper, lower, left, and right bounds of the scrollable region of the viewport."""
+
+    upper: int
+    lower: int
+    left: int
+    right: int
+
+
+class ScrollableArea(NamedTuple):
+    """The width (x) and height (y) of the scrollable region of the viewport."""
+
+    x: int
+    y: int
+
+    @classmethod
+    def from_boundaries(cls, boundaries: Boundaries) -> "ScrollableArea":
+        """Return the width and height of the region enclosed by the boundaries."""
+        return cls(boundaries.right - boundaries.left, boundaries.lower - boundaries.upper)
+
 
 def calculate_boundaries_and_scrollable_area(
-    driver: WebDriver, **kwargs: any
-) -> tuple[dict, dict]:
+    driver: WebDriver,
+    *,
+    upper_cf: float = 0.20,
+    lower_cf: float = 0.90,
+    left_cf: float = 0.10,
+    right_cf: float = 0.90,
+) -> tuple[Boundaries, ScrollableArea]:
     """
     Calculate and return scrolling boundaries and scrollable area based on crop factors.
 
+    Args:
+        driver: The Appium driver instance.
+        upper_cf: Fraction of the viewport height at which the upper bound sits.
+        lower_cf: Fraction of the viewport height at which the lower bound sits.
+        left_cf: Fraction of the viewport width at which the left bound sits.
+        right_cf: Fraction of the viewport width at which the right bound sits.
+
     Returns:
-        tuple: A tuple containing two dictionaries:
-            - boundaries: Dictionary with upper, lower, left, and right bounds
-            - scrollable_area: Dictionary with x and y dimensions
+        tuple: A tuple containing:
+            - boundaries: Boundaries with upper, lower, left, and right bounds
+            - scrollable_area: ScrollableArea with x and y dimensions
 
     """
     viewport_width, viewport_height = retrieve_viewport_dimensions(driver)
-    crop_factors = {
-        "upper_cf": kwargs.get("upper_cf", 0.20),
-        "lower_cf": kwargs.get("lower_cf", 0.90),
-        "left_cf": kwargs.get("left_cf", 0.10),
-        "right_cf": kwargs.get("right_cf", 0.90),
-    }
-    boundaries = {
-        "upper": int(viewport_height * crop_factors["upper_cf"]),
-        "lower": int(viewport_height * crop_factors["lower_cf"]),
-        "left": int(viewport_width * crop_factors["left_cf"]),
-        "right": int(viewport_width * crop_factors["right_cf"]),
-    }
-    scrollable_area = {
-        "x": boundaries["right"] - boundaries["left"],
-        "y": boundaries["lower"] - boundaries["upper"],
-    }
-
-    return crop_factors, boundaries, scrollable_area
+    boundaries = calculate_boundaries(
+        viewport_width, viewport_height, upper_cf, lower_cf, left_cf, right_cf
+    )
+
+    return boundaries, ScrollableArea.from_boundaries(boundaries)
+
+
+@lru_cache(maxsize=32)
+def calculate_boundaries(
+    viewport_width: int,
+    viewport_height: int,
+    upper_cf: float = 0.20,
+    lower_cf: float = 0.90,
+    left_cf: float = 0.10,
+    right_cf: float = 0.90,
+) -> Boundaries:
+    """
+    Scale known viewport dimensions by the crop factors, without querying the driver.
+
+    Results are cached, as the same viewport and crop factors are reused across gestures.
+
+    Args:
+        viewport_width: The width of the viewport.
+        viewport_height: The height of the viewport.
+        upper_cf: Fraction of the viewport height at which the upper bound sits.
+        lower_cf: Fraction of the viewport height at which the lower bound sits.
+        left_cf: Fraction of the viewport width at which the left bound sits.
+        right_cf: Fraction of the viewport width at which the right bound sits.
+
+    Returns:
+        Boundaries with the upper, lower, left, and right bounds.
+    """
+    return Boundaries(
+        int(viewport_height * upper_cf),
+        int(viewport_height * lower_cf),
+        int(viewport_width * left_cf),
+        int(viewport_width * right_cf),
+    )
+
+
+@contextmanager
+def element_rect_cache() -> Iterator[None]:
+    """
+    Reuse element locations and sizes for the duration of the block.
+
+    Within the block, each element's location and size is read from the driver once
+    and remembered by element id. Gestures that move content clear the remembered
+    values, so only wrap sequences where elements are not moved by other means.
+
+    The remembered values are local to the current context, so threads driving other
+    sessions neither see nor clear them.
+    """
+    token = _rect_cache.set({})
+    try:
+        yield
+    finally:
+        _rect_cache.reset(token)
+
+
+def invalidate_element_rect_cache() -> None:
+    """Forget any element locations and sizes remembered by `element_rect_cache`."""
+    cache = _rect_cache.get()
+    if cache is not None:
+        cache.clear()
 
 
 def _get_element_coordinates(element: WebElement) -> tuple[int, int, int, int]:
     """
-    Get the location and size of an element.
+    Get the location and size of an element in a single rect request.
 
     Args:
         element: The WebElement to calculate points for.
@@ -59,16 +152,95 @@ def _get_element_coordinates(element: WebElement) -> tuple[int, int, int, int]:
     Raises:
         ValueError: If the element dimensions are invalid.
     """
-    x, y = element.location["x"], element.location["y"]
-    width, height = element.size["width"], element.size["height"]
+    cache = _rect_cache.get()
+    if cache is not None and element.id in cache:
+        return cache[element.id]
+
+    try:
+        rect = element.rect
+    except WebDriverException as e:
+        # Servers without the W3C rect endpoint answer with an unknown command or method error,
+        # any other failure such as a stale element is not retried
+        if not isinstance(e, UnknownMethodException) and "unknown command" not in str(e.msg).lower():
+            raise
+        rect = {**element.location, **element.size}
+    x, y, width, height = rect["x"], rect["y"], rect["width"], rect["height"]
 
     if width <= 0 or height <= 0:
         msg = "Invalid element dimensions"
         raise ValueError(msg)
 
+    if cache is not None:
+        cache[element.id] = x, y, width, height
+
     return x, y, width, height
 
 
+class PointGrid(NamedTuple):
+    """
+    The 3x3 grid of anchor points on an element, stored as its x and y axes.
+
+    Attributes:
+        xs: The left, middle, and right x coordinates.
+        ys: The top, middle, and bottom y coordinates.
+    """
+
+    xs: tuple[int, int, int]
+    ys: tuple[int, int, int]
+
+    def point(self, anchor: Anchor) -> tuple[int, int]:
+        """Return a single (x, y) point without expanding the rest of the grid."""
+        row, col = divmod(anchor, 3)
+        return self.xs[col], self.ys[row]
+
+    def as_tuples(self) -> list[tuple[int, int]]:
+        """Return the nine (x, y) points in row-major order, starting at the top-left."""
+        return [(x, y) for y in self.ys for x in self.xs]
+
+
+# Names of the grid points in the row-major order produced by `PointGrid.as_tuples`
+_POINT_KEYS = (
+    "top_left",
+    "top_mid",
+    "top_right",
+    "left_mid",
+    "mid",
+    "right_mid",
+    "bottom_left",
+    "bottom_mid",
+    "bottom_right",
+)
+
+
+def calculate_element_grid(element: WebElement, safe_inset: bool = False) -> PointGrid:
+    """
+    Calculate the grid of anchor points on an element with optional safety insets.
+
+    Args:
+        element: The WebElement to calculate points for.
+        safe_inset: If True, applies a 10% inset to all edge points for safer interaction.
+                    Default is False.
+
+    Returns:
+        A PointGrid holding the three x and three y coordinates of the element's anchor points.
+
+    Raises:
+        ValueError: If the element dimensions are invalid.
+    """
+    x, y, width, height = _get_element_coordinates(element)
+
+    inset_x, inset_y = 0, 0
+    if safe_inset:
+        inset = 0.1  # 10% inset
+        inset_x = int(width * inset)
+        inset_y = int(height * inset)
+
+    return PointGrid(
+        (x + inset_x, x + width // 2, x + width - inset_x),
+        (y + inset_y, y + height // 2, y + height - inset_y),
+    )
+
+
 def calculate_element_points(
     element: WebElement, safe_inset: bool = False
 ) -> dict[str, tuple[int, int]]:
@@ -89,53 +261,29 @@ def calculate_element_points(
     Raises:
         ValueError: If the element dimensions are invalid.
     """
-    try:
-        x, y, width, height = _get_element_coordinates(element)
-
-        mid_x = x + width // 2
-        mid_y = y + height // 2
-        right_x = x + width
-        bottom_y = y + height
-
-        if safe_inset:
-            inset = 0.1  # 10% inset
-            inset_x = int(width * inset)
-            inset_y = int(height * inset)
-
-            return {
-                # Corners
-                "top_left": (x + inset_x, y + inset_y),
-                "top_right": (right_x - inset_x, y + inset_y),
-                "bottom_left": (x + inset_x, bottom_y - inset_y),
-                "bottom_right": (right_x - inset_x, bottom_y - inset_y),
-                # Edge midpoints
-                "top_mid": (mid_x, y + inset_y),
-                "right_mid": (right_x - inset_x, mid_y),
-                "bottom_mid": (mid_x, bottom_y - inset_y),
-                "left_mid": (x + inset_x, mid_y),
-                # Center point
-                "mid": (mid_x, mid_y),
-            }
-
-        return {
-            # Corners
-            "top_left": (x, y),
-            "top_right": (right_x, y),
-            "bottom_left": (x, bottom_y),
-            "bottom_right": (right_x, bottom_y),
-            # Edge midpoints
-            "top_mid": (mid_x, y),
-            "right_mid": (right_x, mid_y),
-            "bottom_mid": (mid_x, bottom_y),
-            "left_mid": (x, mid_y),
-            # Center point
-            "mid": (mid_x, mid_y),
-        }
-
-    except ValueError as e:
-        msg = f"Failed to calculate element points: {str(e)}"
-        logger.error(msg)
-        raise
+    return dict(
+        zip(_POINT_KEYS, calculate_element_grid(element, safe_inset).as_tuples(), strict=True)
+    )
+
+
+def calculate_element_midpoint(element: WebElement) -> tuple[int, int]:
+    """
+    Calculate the center point of an element.
+
+    Equivalent to `calculate_element_points(element)["mid"]` without building the other points.
+
+    Args:
+        element: The WebElement to calculate the center point for.
+
+    Returns:
+        A tuple containing the x and y coordinates of the element's center.
+
+    Raises:
+        ValueError: If the element dimensions are invalid.
+    """
+    x, y, width, height = _get_element_coordinates(element)
+
+    return x + width // 2, y + height // 2
 
 
 def retrieve_element_location(element: WebElement) -> tuple[int, int]:
@@ -148,11 +296,16 @@ def retrieve_element_location(element: WebElement) -> tuple[int, int]:
     Returns:
         A tuple containing the x and y coordinates of the element.
     """
+    cache = _rect_cache.get()
+    if cache is not None and element.id in cache:
+        return cache[element.id][:2]
+
     try:
-        return element.location["x"], element.location["y"]
+        location = element.location
+        return location["x"], location["y"]
     except TimeoutException as e:
-        msg = f"Element not found: {str(e)}"
-        logger.error(msg)
+        logger.error("Element not found: %s", e)
+        msg = f"Element not found: {e}"
         raise NoSuchElementException(msg) from e
 
 
@@ -160,16 +313,52 @@ def retrieve_viewport_dimensions(driver: WebDriver) -> tuple[int, int] | None:
     """
     Retrieve the viewport dimensions from the driver.
 
+    Dimensions are cached per driver session, so only the first call for a session
+    queries the driver. Call `invalidate_viewport_cache` after rotating the device.
+
     Returns:
         A tuple of (width, height) or None if dimensions couldn't be retrieved.
     """
+    session_id = getattr(driver, "session_id", None)
+    if session_id in _viewport_cache:
+        return _viewport_cache[session_id]
+
     try:
         viewport = driver.get_window_size()
         if viewport is None:
             msg = "Failed to retrieve viewport dimensions"
             raise ViewportError(msg)
-        return viewport["width"], viewport["height"]
     except WebDriverException as e:
-        msg = f"Failed to get viewport dimensions: {str(e)}"
-        logger.error(msg)
+        logger.error("Failed to get viewport dimensions: %s", e)
+        msg = f"Failed to get viewport dimensions: {e}"
         raise ViewportError(msg) from e
+
+    dimensions = viewport["width"], viewport["height"]
+    if session_id is not None:
+        _viewport_cache[session_id] = dimensions
+    return dimensions
+
+
+def invalidate_viewport_cache(driver: WebDriver) -> None:
+    """Forget the cached viewport dimensions for the driver's session, e.g. after rotation."""
+    _viewport_cache.pop(getattr(driver, "session_id", None), None)
+
+
+def retrieve_display_density(driver: WebDriver) -> int:
+    """
+    Retrieve the display density (DPI) from the driver.
+
+    The density is fixed for a device, so it is cached per driver session and
+    only the first call for a session queries the driver.
+
+    Returns:
+        The display density of the device.
+    """
+    session_id = getattr(driver, "session_id", None)
+    if session_id in _density_cache:
+        return _density_cache[session_id]
+
+    density = driver.get_display_density()
+    if session_id is not None:
+        _density_cache[session_id] = density
+    return density
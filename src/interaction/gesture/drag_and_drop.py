@@ -1,37 +1,37 @@
 import logging
-from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from dataclasses import dataclass
 
 from appium.webdriver.webdriver import WebDriver
 from appium.webdriver.webelement import WebElement
 
-from .calculations import calculate_element_points
+from .calculations import (
+    calculate_element_midpoint,
+    invalidate_element_rect_cache,
+    retrieve_display_density,
+)
 from .exceptions import DragDropError
 
 logger = logging.getLogger(__name__)
 
+IOS_DRAG_VELOCITY = 400
+IOS_PRESS_DURATION = 0.5
+IOS_HOLD_DURATION = 0.1
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class DragAndDropParameters:
     """Encapsulates the parameters needed to perform the drag and drop gestures."""
 
     element_source: WebElement
     element_target: WebElement
-    _speed: float = field(default=1.0, repr=False)
-
-    @property
-    def speed(self) -> float:
-        """Get the velocity factor for the drag and drop gesture."""
-        return self._speed
-
-    @speed.setter
-    def speed(self, value: float) -> None:
-        if not 0.0 <= value <= 10.0:
-            msg = f"Speed must be between 0.0 and 10.0, got {value}"
-            raise ValueError(msg)
-        self._speed = value
+    speed: float = 1.0
 
     def __post_init__(self):
-        self.speed = self._speed
+        if not 0.0 <= self.speed <= 10.0:
+            msg = f"Speed must be between 0.0 and 10.0, got {self.speed}"
+            raise ValueError(msg)
 
 
 class DragAndDropGestures:
@@ -40,6 +40,10 @@ class DragAndDropGestures:
     def __init__(self, driver: WebDriver, platform: str) -> None:
         self._driver = driver
         self._platform = platform
+        self._android_velocity_base: float | None = None
+        self._drag_impl = (
+            self._drag_drop_android if platform == "android" else self._drag_drop_ios
+        )
 
     def drag_and_drop(
         self,
@@ -66,27 +70,30 @@ class DragAndDropGestures:
             raise ValueError("Source and target elements must be different")
 
         try:
-            init_element = calculate_element_points(p.element_source)
-            init_x, init_y = init_element["mid"]
-            final_element = calculate_element_points(p.element_target)
-            final_x, final_y = final_element["mid"]
-
-            return (
-                self._drag_drop_android(init_x, init_y, final_x, final_y, p.speed)
-                if self._platform == "android"
-                else self._drag_drop_ios(init_x, init_y, final_x, final_y, p.speed)
-            )
+            # Fetch the source rect alongside the target rect, in the caller's context
+            # so both lookups share its element_rect_cache
+            with ThreadPoolExecutor(max_workers=1, thread_name_prefix="drag-and-drop") as executor:
+                init_future = executor.submit(
+                    copy_context().run, calculate_element_midpoint, p.element_source
+                )
+                final_x, final_y = calculate_element_midpoint(p.element_target)
+                init_x, init_y = init_future.result()
+
+            result = self._drag_impl(init_x, init_y, final_x, final_y, p.speed)
+            invalidate_element_rect_cache()
+            return result
         except Exception as e:
-            msg = f"Failed to perform drag and drop: {str(e)}"
-            logger.error(msg)
+            logger.error("Failed to perform drag and drop: %s", e)
+            msg = f"Failed to perform drag and drop: {e}"
             raise DragDropError(msg) from e
 
     def _drag_drop_android(
         self, init_x: int, init_y: int, final_x: int, final_y: int, speed: float
     ) -> bool:
         """Execute Android-specific drag-and-drop gesture."""
-        dpi = self._driver.get_display_density()
-        velocity = (2500 * dpi) * speed
+        if self._android_velocity_base is None:
+            self._android_velocity_base = 2500 * retrieve_display_density(self._driver)
+        velocity = self._android_velocity_base * speed
         return self._driver.execute_script(
             "mobile: dragGesture",
             {
@@ -102,14 +109,12 @@ class DragAndDropGestures:
         self, init_x: int, init_y: int, final_x: int, final_y: int, speed: float
     ) -> bool:
         """Execute iOS-specific drag-and-drop gesture."""
-        velocity = 400 * speed
-        press_duration = 0.5
-        hold_duration = 0.1
+        velocity = IOS_DRAG_VELOCITY * speed
         return self._driver.execute_script(
             "mobile: dragFromToWithVelocity",
             {
-                "pressDuration": press_duration,
-                "holdDuration": hold_duration,
+                "pressDuration": IOS_PRESS_DURATION,
+                "holdDuration": IOS_HOLD_DURATION,
                 "fromX": init_x,
                 "fromY": init_y,
                 "toX": final_x,
@@ -1,7 +1,18 @@
-from enum import Enum
+from enum import Enum, IntEnum, unique
 
+try:
+    from enum import StrEnum
+except ImportError:  # Python < 3.11
 
-class Direction(Enum):
+    class StrEnum(str, Enum):
+        """Enum whose members are strings and compare equal to their values."""
+
+        def __str__(self) -> str:
+            return self.value
+
+
+@unique
+class Direction(StrEnum):
     """Direction of the swipe action."""
 
     UP = "up"
@@ -12,7 +23,8 @@ class Direction(Enum):
     OUT = "out"
 
 
-class SeekDirection(Enum):
+@unique
+class SeekDirection(StrEnum):
     """
     Direction in which to seek for an element.
     """
@@ -23,7 +35,8 @@ class SeekDirection(Enum):
     RIGHT = "right"
 
 
-class UiSelector(Enum):
+@unique
+class UiSelector(StrEnum):
     """
     Android UiSelector method to locate an element.
     """
@@ -37,3 +50,19 @@ class UiSelector(Enum):
     TEXT_CONTAINS = "textContains"
     TEXT_MATCHES = "textMatches"
     TEXT_STARTS_WITH = "textStartsWith"
+
+
+class Anchor(IntEnum):
+    """
+    Row-major index of an anchor point within an element's 3x3 point grid.
+    """
+
+    TOP_LEFT = 0
+    TOP_MID = 1
+    TOP_RIGHT = 2
+    LEFT_MID = 3
+    MID = 4
+    RIGHT_MID = 5
+    BOTTOM_LEFT = 6
+    BOTTOM_MID = 7
+    BOTTOM_RIGHT = 8
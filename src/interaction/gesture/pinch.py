@@ -4,6 +4,7 @@ from dataclasses import dataclass, field
 from appium.webdriver.webdriver import WebDriver
 from appium.webdriver.webelement import WebElement
 
+from .calculations import invalidate_element_rect_cache, retrieve_display_density
 from .exceptions import ZoomError
 
 logger = logging.getLogger(__name__)
@@ -86,19 +87,21 @@ class PinchGestures:
         """
         p = PinchParameters(element, percent, speed)
         try:
-            return (
+            result = (
                 self._pinch_open_android(p.element, p.percent, p.speed)
                 if self._platform == "android"
                 else self._pinch_open_ios(p.element, p.percent, p.speed)
             )
+            invalidate_element_rect_cache()
+            return result
         except Exception as e:
-            msg = f"Failed to perform pinch open: {str(e)}"
-            logger.error(msg)
+            logger.error("Failed to perform pinch open: %s", e)
+            msg = f"Failed to perform pinch open: {e}"
             raise ZoomError(msg) from e
 
     def _pinch_open_android(self, element: WebElement, percent: float, speed: float) -> bool:
         """Execute Android-specific pinch-open gesture."""
-        dpi = self._driver.get_display_density()
+        dpi = retrieve_display_density(self._driver)
         velocity = (2500 * dpi) * speed
         return self._driver.execute_script(
             "mobile: pinchOpenGesture",
@@ -155,19 +158,21 @@ class PinchGestures:
         """
         p = PinchParameters(element, percent, speed)
         try:
-            return (
+            result = (
                 self._pinch_close_android(p.element, p.percent, p.speed)
                 if self._platform == "android"
                 else self._pinch_close_ios(p.element, p.percent, p.speed)
             )
+            invalidate_element_rect_cache()
+            return result
         except Exception as e:
-            msg = f"Failed to perform pinch close: {str(e)}"
-            logger.error(msg)
+            logger.error("Failed to perform pinch close: %s", e)
+            msg = f"Failed to perform pinch close: {e}"
             raise ZoomError(msg) from e
 
     def _pinch_close_android(self, element: WebElement, percent: float, speed: float) -> bool:
         """Execute Android-specific pinch-close gesture."""
-        dpi = self._driver.get_display_density()
+        dpi = retrieve_display_density(self._driver)
         velocity = (2500 * dpi) * speed
         return self._driver.execute_script(
             "mobile: pinchCloseGesture",
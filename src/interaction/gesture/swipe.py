@@ -1,25 +1,62 @@
 import logging
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import NoReturn
 
 from appium.webdriver.common.appiumby import AppiumBy
 from appium.webdriver.webdriver import WebDriver
 from appium.webdriver.webelement import WebElement
 from selenium.common.exceptions import NoSuchElementException, WebDriverException
-from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.actions import interaction
 from selenium.webdriver.common.actions.action_builder import ActionBuilder
 from selenium.webdriver.common.actions.pointer_input import PointerInput
 
-from .calculations import calculate_element_points
-from .enums import Direction, SeekDirection
+from .calculations import (
+    ScrollableArea,
+    calculate_boundaries,
+    calculate_element_grid,
+    calculate_element_midpoint,
+    invalidate_element_rect_cache,
+    retrieve_viewport_dimensions,
+)
+from .enums import Anchor, Direction, SeekDirection
+from .exceptions import SwipeError
 
 logger = logging.getLogger(__name__)
 
 TIMEOUT = 0.25
 SWIPE_ACTION_THRESHOLD = 50
+SWIPE_RELEASE_PAUSE = 0.5
+MAX_SEEK_ATTEMPTS = 5
 CROP_FACTOR_UPPER = 0.20
 CROP_FACTOR_LOWER = 0.90
 CROP_FACTOR_LEFT = 0.10
 CROP_FACTOR_RIGHT = 0.90
+PARTIAL_SWIPE_FACTOR_X = 0.2
+PARTIAL_SWIPE_FACTOR_Y = 0.4
+PARTIAL_SWIPE_FACTOR_STEP = 0.1
+
+# UiAutomator query that scrolls the first scrollable container until the selector matches
+_SCROLL_INTO_VIEW_QUERY = (
+    "new UiScrollable(new UiSelector().scrollable(true)).scrollIntoView({})"
+)
+
+# Start and end points used by `on_element`, keyed by swipe direction
+_ON_ELEMENT_ENDPOINTS = {
+    Direction.UP: (Anchor.BOTTOM_MID, Anchor.TOP_MID),
+    Direction.DOWN: (Anchor.TOP_MID, Anchor.BOTTOM_MID),
+    Direction.RIGHT: (Anchor.LEFT_MID, Anchor.RIGHT_MID),
+    Direction.LEFT: (Anchor.RIGHT_MID, Anchor.LEFT_MID),
+}
+
+# Axis, start bound, end bound, and offset sign of each fallback seek swipe
+_SEEK_SWIPES = {
+    SeekDirection.UP: ("y", "upper", "lower", -1),
+    SeekDirection.DOWN: ("y", "lower", "upper", 1),
+    SeekDirection.LEFT: ("x", "left", "right", -1),
+    SeekDirection.RIGHT: ("x", "right", "left", 1),
+}
 
 
 # class AndroidParams(TypedDict, total=False):
@@ -43,54 +80,232 @@ CROP_FACTOR_RIGHT = 0.90
 class SwipeGestures:
     """Access swipe related gestures."""
 
-    def __init__(self, driver: WebDriver, platform: str) -> None:
+    def __init__(
+        self,
+        driver: WebDriver,
+        platform: str,
+        release_pause: float = SWIPE_RELEASE_PAUSE,
+        viewport: tuple[int, int] | None = None,
+        max_attempts: int = MAX_SEEK_ATTEMPTS,
+    ) -> None:
         """
         Initialize the SwipeGestures instance.
 
         Args:
             driver (WebDriver): A WebDriver instance providing access to the app.
             platform (str): The platform type ('Android' or 'iOS').
+            release_pause (float, optional): Seconds to hold at the end of a swipe before releasing.
+                Holding stops the swipe from turning into a fling, which keeps scroll distances predictable.
+                Lower values make each swipe faster at the cost of some overscroll,
+                and 0 releases immediately. Defaults to 0.5.
+            viewport (tuple[int, int] | None, optional): The viewport width and height, if already known.
+                Supplying it skips the window size query to the driver. Defaults to None.
+            max_attempts (int, optional): The number of swipes made while seeking an element
+                before giving up. Defaults to 5.
 
         """
         self._driver = driver
+        self._release_pause = release_pause
         self._platform = platform.lower()
-        self._max_attempts = 5
-        self._viewport = self._driver.get_window_size()
-        self._viewport_width = self._viewport["width"]
-        self._viewport_height = self._viewport["height"]
+        self._max_attempts = max_attempts
+        self._action: ActionBuilder | None = None
+        self._batching = False
+        self._implicit_wait: float | None = None
+        self._viewport_width, self._viewport_height = (
+            viewport or retrieve_viewport_dimensions(self._driver)
+        )
         self._viewport_x_mid_point = self._viewport_width // 2
         self._viewport_y_mid_point = self._viewport_height // 2
-        self._crop_factors = {
-            "upper_cf": CROP_FACTOR_UPPER,
-            "lower_cf": CROP_FACTOR_LOWER,
-            "left_cf": CROP_FACTOR_LEFT,
-            "right_cf": CROP_FACTOR_RIGHT,
-        }
-        self._boundaries = {
-            "upper": int(self._viewport_height * self._crop_factors["upper_cf"]),
-            "lower": int(self._viewport_height * self._crop_factors["lower_cf"]),
-            "left": int(self._viewport_width * self._crop_factors["left_cf"]),
-            "right": int(self._viewport_width * self._crop_factors["right_cf"]),
+        self._boundaries = calculate_boundaries(
+            self._viewport_width,
+            self._viewport_height,
+            CROP_FACTOR_UPPER,
+            CROP_FACTOR_LOWER,
+            CROP_FACTOR_LEFT,
+            CROP_FACTOR_RIGHT,
+        )
+        self._scrollable_area = ScrollableArea.from_boundaries(self._boundaries)
+        self._seek_swipes = {
+            direction: (
+                axis,
+                getattr(self._boundaries, initial),
+                getattr(self._boundaries, final),
+                self._seek_offsets(axis, sign),
+            )
+            for direction, (axis, initial, final, sign) in _SEEK_SWIPES.items()
         }
-        self._scrollable_area = {
-            "x": self._boundaries["right"] - self._boundaries["left"],
-            "y": self._boundaries["lower"] - self._boundaries["upper"],
+        self._endpoints = {
+            "up": (
+                (self._viewport_x_mid_point, self._boundaries.lower),
+                (self._viewport_x_mid_point, self._boundaries.upper),
+            ),
+            "down": (
+                (self._viewport_x_mid_point, self._boundaries.upper),
+                (self._viewport_x_mid_point, self._boundaries.lower),
+            ),
+            "left": (
+                (self._boundaries.right, self._viewport_y_mid_point),
+                (self._boundaries.left, self._viewport_y_mid_point),
+            ),
+            "right": (
+                (self._boundaries.left, self._viewport_y_mid_point),
+                (self._boundaries.right, self._viewport_y_mid_point),
+            ),
+            "previous": (
+                (0, self._viewport_y_mid_point),
+                (self._viewport_width, self._viewport_y_mid_point),
+            ),
+            "next": (
+                (self._viewport_width, self._viewport_y_mid_point),
+                (0, self._viewport_y_mid_point),
+            ),
         }
 
-    def _create_action(self) -> ActionChains:
+    @classmethod
+    def swipe_all(cls, instances: Sequence["SwipeGestures"], direction: Direction) -> None:
         """
-        Create an ActionChains object for the driver.
+        Perform the same full swipe on several sessions concurrently.
 
-        Returns:
-            ActionChains: The ActionChains object configured for the driver.
+        Each instance drives its own device, so the requests are independent and are sent
+        from a thread per instance instead of one after another.
+
+        Args:
+            instances (Sequence[SwipeGestures]): The SwipeGestures instances to swipe on.
+            direction (Direction): The direction to swipe (UP, DOWN, LEFT, or RIGHT).
 
+        Raises:
+            ValueError: If the direction is not a viewport swipe direction.
+            SwipeError: If a swipe fails on any of the sessions.
+
+        """
+        if direction not in _ON_ELEMENT_ENDPOINTS:
+            msg = f"Invalid swipe direction: '{direction}'."
+            raise ValueError(msg)
+        if not instances:
+            return
+
+        with ThreadPoolExecutor(
+            max_workers=len(instances), thread_name_prefix="swipe"
+        ) as executor:
+            futures = [executor.submit(getattr(instance, str(direction))) for instance in instances]
+        # Worker threads run in their own contexts, so clear the caller's remembered rects here
+        invalidate_element_rect_cache()
+        for future in futures:
+            future.result()
+
+    def _seek_offsets(self, axis: str, sign: int) -> tuple[float, ...]:
         """
-        action = ActionChains(self._driver)
-        action.w3c_actions = ActionBuilder(
-            self._driver,
-            mouse=PointerInput(interaction.POINTER_TOUCH, "touch"),
+        Calculate the partial swipe offset used on each fallback seek attempt.
+
+        Each failed attempt withholds less of the scrollable area, so the swipes lengthen.
+        """
+        if axis == "y":
+            base, extent = PARTIAL_SWIPE_FACTOR_Y, self._scrollable_area.y
+        else:
+            base, extent = PARTIAL_SWIPE_FACTOR_X, self._scrollable_area.x
+        return tuple(
+            extent * max(base - PARTIAL_SWIPE_FACTOR_STEP * attempt, 0.0) * sign
+            for attempt in range(self._max_attempts)
         )
-        return action
+
+    def _create_action(self) -> ActionBuilder:
+        """
+        Return the touch action builder for the driver, ready for a new gesture.
+
+        The builder and its touch pointer are created on first use and reused
+        for subsequent gestures, with any actions left over from a failed gesture cleared.
+        Inside `batched`, the queued actions are kept so the next gesture is appended to them.
+
+        Returns:
+            ActionBuilder: The ActionBuilder configured with a touch pointer for the driver.
+
+        """
+        if self._action is None:
+            self._action = ActionBuilder(
+                self._driver,
+                mouse=PointerInput(interaction.POINTER_TOUCH, "touch"),
+            )
+        elif not self._batching:
+            self._reset_action(self._action)
+        return self._action
+
+    @contextmanager
+    def batched(self) -> Iterator[None]:
+        """
+        Queue the swipes made within the block and send them in a single request on exit.
+
+        Intended for sequences of viewport and `on_element` swipes. Element positions read inside
+        the block do not reflect queued swipes, and `element_into_view` raises a `SwipeError` within it,
+        as it needs each swipe to complete before probing for the element.
+        If the block raises or the request fails, the queued swipes are discarded.
+
+        Raises:
+            SwipeError: If the queued swipes fail to perform.
+
+        """
+        if self._batching:
+            yield
+            return
+
+        action = self._create_action()
+        self._batching = True
+        completed = False
+        try:
+            yield
+            completed = True
+        finally:
+            self._batching = False
+            # Never let strokes from a failed batch leak into the next request
+            if not completed:
+                self._reset_action(action)
+
+        if any(device.actions for device in action.devices):
+            try:
+                self._perform(action)
+            except WebDriverException as e:
+                self._reset_action(action)
+                self._log_and_raise("Failed to perform batched swipes", e)
+
+    @staticmethod
+    def _reset_action(action: ActionBuilder) -> None:
+        """Discard queued actions locally, without a round trip to the driver."""
+        for device in action.devices:
+            device.clear_actions()
+
+    def _perform(self, action: ActionBuilder) -> None:
+        """Send the queued actions and forget element rects they may have moved."""
+        if self._batching:
+            return
+        action.perform()
+        invalidate_element_rect_cache()
+
+    @staticmethod
+    def _log_and_raise(message: str, error: Exception) -> NoReturn:
+        """Log a failed gesture and raise it as a SwipeError chained to the original error."""
+        logger.error("%s: %s", message, error)
+        msg = f"{message}: {error}"
+        raise SwipeError(msg) from error
+
+    @contextmanager
+    def _no_implicit_wait(self) -> Iterator[None]:
+        """
+        Disable the session's implicit wait for the duration of the block.
+
+        Lookups that miss then fail immediately instead of polling until the implicit wait expires,
+        and the original timeout is restored afterwards. The timeout is read from the session once
+        per instance, and left untouched when it is already 0.
+        """
+        if self._implicit_wait is None:
+            self._implicit_wait = self._driver.timeouts.implicit_wait
+        if not self._implicit_wait:
+            yield
+            return
+
+        self._driver.implicitly_wait(0)
+        try:
+            yield
+        finally:
+            self._driver.implicitly_wait(self._implicit_wait)
 
     def element_into_view(
         self,
@@ -99,7 +314,8 @@ class SwipeGestures:
         value_i: str | None = None,
         locator_method_i: AppiumBy = None,
         direction: SeekDirection = SeekDirection.DOWN,
-    ) -> WebDriver | None:
+        end_reached: Callable[[], bool] | None = None,
+    ) -> WebElement | None:
         """
         Swipe to bring an element into view.
 
@@ -117,104 +333,171 @@ class SwipeGestures:
             value_i (str | None): The locator value for the element to swipe to view (e.g., label == 'Flowers').
             locator_method_i (AppiumBy | None): The method to locate the element (e.g., AppiumBy.IOS_PREDICATE).
             direction (SeekDirection): The direction to scroll (e.g., SeekDirection.DOWN).
+            end_reached (Callable[[], bool] | None): Optional check called after each fallback swipe.
+                Returning True stops the search early, e.g. once the end of a list is visible.
     
         Returns:
-            WebDriver | None: The located element if found; otherwise, None.
+            WebElement | None: The located element if found; otherwise, None.
     
         Raises:
             ValueError: If the specified platform is unknown or unspecified.
+            SwipeError: If the fallback swipes fail, or are needed inside `batched()`.
 
         Android: Supports all locator methods, however UiSelector is highly preferred.  
         iOS: Supports all locator methods, however NSPredicate is highly preferred.
 
         """
         if self._platform == "android":
-            return self._scroll_to_android(value_a, locator_method_a, direction)
+            return self._scroll_to_android(value_a, locator_method_a, direction, end_reached)
 
         elif self._platform == "ios":
-            return self._scroll_to_ios(value_i, locator_method_i, direction)
+            return self._scroll_to_ios(value_i, locator_method_i, direction, end_reached)
 
         else:
             msg = "Unspecified or unknown platform."
             raise ValueError(msg)
 
-    def _scroll_to_android(self, value: str, locator_method: AppiumBy, direction: SeekDirection = None) -> WebDriver | None:
+    def _scroll_to_android(
+        self,
+        value: str,
+        locator_method: AppiumBy,
+        direction: SeekDirection = None,
+        end_reached: Callable[[], bool] | None = None,
+    ) -> WebElement | None:
         if locator_method == AppiumBy.ANDROID_UIAUTOMATOR:
             # ui_selector = kwargs.get("ui_selector").value
-            query = f"new UiScrollable(new UiSelector().scrollable(true)).scrollIntoView({value})"
-            return self._driver.find_element(AppiumBy.ANDROID_UIAUTOMATOR, query)
+            query = _SCROLL_INTO_VIEW_QUERY.format(value)
+            element = self._driver.find_element(AppiumBy.ANDROID_UIAUTOMATOR, query)
+            invalidate_element_rect_cache()
+            return element
         msg = "Locator was not of type AppiumBy.ANDROID_UIAUTOMATOR or failed to locate element within viewport,"
         "falling back to alternative method."
         logger.info(msg)
-        self._fallback_scroll_to_element(value, locator_method, direction)
-        return None
+        return self._fallback_scroll_to_element(value, locator_method, direction, end_reached)
 
-    def _scroll_to_ios(self, value: str, locator_method: AppiumBy, direction: SeekDirection) -> WebDriver | None:
+    def _scroll_to_ios(
+        self,
+        value: str,
+        locator_method: AppiumBy,
+        direction: SeekDirection,
+        end_reached: Callable[[], bool] | None = None,
+    ) -> WebElement | None:
+        if locator_method == AppiumBy.IOS_PREDICATE:
+            return self._scroll_to_ios_predicate(value, direction, end_reached)
         try:
-            element = self._driver.find_element(locator_method, value)
+            with self._no_implicit_wait():
+                element = self._driver.find_element(locator_method, value)
             self._driver.execute_script(
                 "mobile: scrollToElement",
                 {
                     "elementId": element,
                 },
             )
+            invalidate_element_rect_cache()
         except NoSuchElementException:
             msg = "Failed to locate element within viewport, falling back to alternative method."
             logger.info(msg)
-            self._fallback_scroll_to_element(value, locator_method, direction)
-            return None
+            return self._fallback_scroll_to_element(
+                value, locator_method, direction, end_reached, probe_first=False
+            )
         else:
             return element
 
+    def _scroll_to_ios_predicate(
+        self,
+        value: str,
+        direction: SeekDirection,
+        end_reached: Callable[[], bool] | None = None,
+    ) -> WebElement | None:
+        """
+        Scroll to an element matching an NSPredicate, searching on the device.
+
+        XCUITest scrolls until the match is visible in a single command, after which it is looked up.
+        """
+        try:
+            self._driver.execute_script("mobile: scroll", {"predicateString": value})
+            invalidate_element_rect_cache()
+            return self._driver.find_element(AppiumBy.IOS_PREDICATE, value)
+        except WebDriverException:
+            msg = "Failed to scroll to element by predicate, falling back to alternative method."
+            logger.info(msg)
+            return self._fallback_scroll_to_element(value, AppiumBy.IOS_PREDICATE, direction, end_reached)
+
     # def _query_builder_uiautomator(self, value: str, locator_method) -> str:
     #     ui_selector = kwargs.get("ui_selector")
     #     return f'(new UiSelector().{ui_selector}("{value}"))'
 
-    def _fallback_scroll_to_element(self, value: str, locator_method: AppiumBy, direction: SeekDirection = None) -> WebDriver | None:
+    def _probe_for_element(self, value: str, locator_method: AppiumBy) -> WebElement | None:
+        """Return the first element matching the locator, or None without raising if there is none."""
+        return next(iter(self._driver.find_elements(locator_method, value)), None)
+
+    def _fallback_scroll_to_element(
+        self,
+        value: str,
+        locator_method: AppiumBy,
+        direction: SeekDirection = None,
+        end_reached: Callable[[], bool] | None = None,
+        probe_first: bool = True,
+    ) -> WebElement | None:
+        """
+        Swipe in the seek direction, probing for the element between swipes.
+
+        Pass `probe_first=False` when the caller has just failed to find the element,
+        so the search starts with a swipe instead of repeating that lookup.
+        """
+        if self._batching:
+            msg = "Cannot swipe an element into view inside batched(), as queued swipes are not sent until it exits."
+            logger.error(msg)
+            raise SwipeError(msg)
+
         action = self._create_action()
-        for _ in range(self._max_attempts):
-            try:
-                element = self._driver.find_element(locator_method, value)
-                element_x, element_y = calculate_element_points(element)["mid"]
-
-                if direction in [SeekDirection.UP, SeekDirection.DOWN]:
-                    self._swipe_element_into_view_vertical(action, element_y, direction)
-                    return element
-                elif direction in [SeekDirection.LEFT, SeekDirection.RIGHT]:  # noqa: RET505
-                    self._swipe_element_into_view_horizontal(
-                        action,
-                        element_x,
-                        direction,
+        try:
+            with self._no_implicit_wait():
+                end_of_content = False
+                # Probe once more after the final swipe, so the last swipe is never wasted
+                for attempt in range(self._max_attempts + 1):
+                    element = (
+                        self._probe_for_element(value, locator_method)
+                        if attempt or probe_first
+                        else None
                     )
-                    return element
-            except NoSuchElementException:
-                swipe_actions = {
-                    SeekDirection.UP: lambda: self._perform_navigation_partial_y(
-                        action,
-                        self._boundaries["upper"],
-                        self._boundaries["lower"],
-                        self._scrollable_area["y"] * -0.4,
-                    ),
-                    SeekDirection.DOWN: lambda: self._perform_navigation_partial_y(
-                        action,
-                        self._boundaries["lower"],
-                        self._boundaries["upper"],
-                        self._scrollable_area["y"] * 0.4,
-                    ),
-                    SeekDirection.LEFT: lambda: self._perform_navigation_partial_x(
-                        action,
-                        self._boundaries["left"],
-                        self._boundaries["right"],
-                        self._scrollable_area["x"] * -0.2,
-                    ),
-                    SeekDirection.RIGHT: lambda: self._perform_navigation_partial_x(
-                        action,
-                        self._boundaries["right"],
-                        self._boundaries["left"],
-                        self._scrollable_area["x"] * 0.2,
-                    ),
-                }
-                swipe_actions[direction]()
+                    if element is not None:
+                        element_x, element_y = calculate_element_midpoint(element)
+
+                        # Elements already inside the scrollable bounds need no further swiping
+                        if direction in (SeekDirection.UP, SeekDirection.DOWN):
+                            if not self._boundaries.upper <= element_y <= self._boundaries.lower:
+                                self._swipe_element_into_view_vertical(action, element_y, direction)
+                            return element
+                        elif direction in (SeekDirection.LEFT, SeekDirection.RIGHT):  # noqa: RET505
+                            if not self._boundaries.left <= element_x <= self._boundaries.right:
+                                self._swipe_element_into_view_horizontal(
+                                    action,
+                                    element_x,
+                                    direction,
+                                )
+                            return element
+                    elif attempt == self._max_attempts or end_of_content:
+                        break
+                    else:
+                        axis, initial, final, offsets = self._seek_swipes[direction]
+                        navigate = (
+                            self._perform_navigation_partial_y
+                            if axis == "y"
+                            else self._perform_navigation_partial_x
+                        )
+                        navigate(action, initial, final, offsets[attempt])
+
+                        # Further swipes cannot reveal the element once the content stops scrolling
+                        end_of_content = end_reached is not None and end_reached()
+        except (
+            WebDriverException,
+            KeyError,
+            ZeroDivisionError,
+            TypeError,
+            ValueError,
+        ) as e:
+            self._log_and_raise("Failed to swipe element into view", e)
 
         return None
 
@@ -222,248 +505,213 @@ class SwipeGestures:
         """Perform a full upward swipe of the calculated viewport."""
         action = self._create_action()
         try:
-            self._perform_navigation_full_y(
-                action, self._boundaries["lower"], self._boundaries["upper"]
-            )
+            self._perform_navigation(action, *self._endpoints["up"])
         except (WebDriverException, KeyError, AttributeError) as e:
-            self._log_and_raise(f"Failed to swipe up: {e}", e)
+            self._log_and_raise("Failed to swipe up", e)
 
     def down(self) -> None:
         """Perform a full downward swipe of the calculated viewport."""
         action = self._create_action()
         try:
-            self._perform_navigation_full_y(
-                action, self._boundaries["upper"], self._boundaries["lower"]
-            )
+            self._perform_navigation(action, *self._endpoints["down"])
         except (WebDriverException, KeyError, AttributeError) as e:
-            self._log_and_raise(f"Failed to swipe down: {e}", e)
+            self._log_and_raise("Failed to swipe down", e)
 
     def left(self) -> None:
         """Perform a full leftward swipe of the calculated viewport."""
         action = self._create_action()
         try:
-            self._perform_navigation_full_x(
-                action, self._boundaries["right"], self._boundaries["left"]
-            )
+            self._perform_navigation(action, *self._endpoints["left"])
         except (WebDriverException, KeyError, AttributeError) as e:
-            self._log_and_raise(f"Failed to swipe left: {e}", e)
+            self._log_and_raise("Failed to swipe left", e)
 
     def right(self) -> None:
         """Perform a full rightward swipe of the calculated viewport."""
         action = self._create_action()
         try:
-            self._perform_navigation_full_x(
-                action, self._boundaries["left"], self._boundaries["right"]
-            )
+            self._perform_navigation(action, *self._endpoints["right"])
         except (WebDriverException, KeyError, AttributeError) as e:
-            self._log_and_raise(f"Failed to swipe right: {e}", e)
+            self._log_and_raise("Failed to swipe right", e)
 
     def previous(self) -> None:
         """Perform a complete swipe from the left-edge of the viewport."""
         action = self._create_action()
         try:
-            self._perform_navigation_full_x(action, 0, self._viewport_width)
+            self._perform_navigation(action, *self._endpoints["previous"])
         except (WebDriverException, AttributeError) as e:
-            self._log_and_raise(f"Failed to swipe to previous: {e}", e)
+            self._log_and_raise("Failed to swipe to previous", e)
 
     def next(self) -> None:
         """Perform a complete swipe from the right-edge of the viewport."""
         action = self._create_action()
         try:
-            self._perform_navigation_full_x(action, self._viewport_width, 0)
+            self._perform_navigation(action, *self._endpoints["next"])
         except (WebDriverException, AttributeError) as e:
-            self._log_and_raise(f"Failed to swipe to next: {e}", e)
+            self._log_and_raise("Failed to swipe to next", e)
 
     def on_element(self, element: WebElement, direction: Direction) -> None:
         """Swipe on a specific element in the given direction."""
         try:
             action = self._create_action()
-            element_points = calculate_element_points(element, True)
-
-            points_map = {
-                Direction.UP: (element_points["bottom_mid"], element_points["top_mid"]),
-                Direction.DOWN: (
-                    element_points["top_mid"],
-                    element_points["bottom_mid"],
-                ),
-                Direction.RIGHT: (
-                    element_points["left_mid"],
-                    element_points["right_mid"],
-                ),
-                Direction.LEFT: (
-                    element_points["right_mid"],
-                    element_points["left_mid"],
-                ),
-            }
-
-            self._perform_navigation_on_element(action, *points_map[direction])
+            grid = calculate_element_grid(element, True)
+
+            start, end = _ON_ELEMENT_ENDPOINTS[direction]
+
+            self._perform_swipe(action, grid.point(start), grid.point(end))
+            self._perform(action)
         except (WebDriverException, KeyError, AttributeError, ValueError) as e:
-            self._log_and_raise(f"Failed to swipe on element: {e}", e)
+            self._log_and_raise("Failed to swipe on element", e)
 
     def _swipe_element_into_view_vertical(
-        self, action: ActionChains, element_y: int, direction: SeekDirection
+        self, action: ActionBuilder, element_y: int, direction: SeekDirection
     ) -> None:
         """Perform vertical swipes to bring an element into view."""
-        try:
-            distance_to_element = element_y - self._boundaries["lower"]
-            actions_total = distance_to_element / self._scrollable_area["y"]
-            actions_complete = int(distance_to_element // self._scrollable_area["y"])
-            actions_partial = int(
-                self._scrollable_area["y"] * (actions_total - actions_complete)
-            )
+        # Measure from the bound on the seek side, so the final stroke stops at the element
+        distance_to_element = (
+            self._boundaries.upper - element_y
+            if direction == SeekDirection.UP
+            else element_y - self._boundaries.lower
+        )
+        actions_complete, actions_partial = divmod(
+            abs(distance_to_element), self._scrollable_area.y
+        )
 
-            start, end = (
-                (self._boundaries["upper"], self._boundaries["lower"])
-                if direction == SeekDirection.UP
-                else (self._boundaries["lower"], self._boundaries["upper"])
-            )
+        _, start, end, _ = self._seek_swipes[direction]
 
-            if actions_total > 1:
-                self._perform_navigation_full_y(action, start, end, actions_complete)
-            if actions_partial > SWIPE_ACTION_THRESHOLD:
-                self._perform_navigation_partial_y(action, start, end, actions_partial)
-        except (
-            WebDriverException,
-            KeyError,
-            ZeroDivisionError,
-            TypeError,
-            ValueError,
-        ) as e:
-            self._log_and_raise(f"Failed to swipe element into view vertically: {e}", e)
+        if actions_complete > 0:
+            self._perform_navigation_full_y(
+                action, start, end, actions_complete, perform=False
+            )
+        if actions_partial > SWIPE_ACTION_THRESHOLD:
+            # The remainder is a shorter stroke from the same starting bound
+            self._perform_navigation_partial_y(
+                action, start, start, actions_partial if end > start else -actions_partial, perform=False
+            )
+        if actions_complete > 0 or actions_partial > SWIPE_ACTION_THRESHOLD:
+            self._perform(action)
 
     def _swipe_element_into_view_horizontal(
-        self, action: ActionChains, element_x: int, direction: SeekDirection
+        self, action: ActionBuilder, element_x: int, direction: SeekDirection
     ) -> None:
         """Perform horizontal swipes to bring an element into view."""
-        try:
-            distance_to_element = element_x - self._boundaries["left"]
-            actions_total = distance_to_element / self._scrollable_area["x"]
-            actions_complete = int(distance_to_element // self._scrollable_area["x"])
-            actions_partial = int(
-                self._scrollable_area["x"] * (actions_total - actions_complete)
-            )
+        # Measure from the bound on the seek side, so the final stroke stops at the element
+        distance_to_element = (
+            self._boundaries.left - element_x
+            if direction == SeekDirection.LEFT
+            else element_x - self._boundaries.right
+        )
+        actions_complete, actions_partial = divmod(
+            abs(distance_to_element), self._scrollable_area.x
+        )
 
-            start, end = (
-                (self._boundaries["right"], self._boundaries["left"])
-                if direction == SeekDirection.LEFT
-                else (self._boundaries["left"], self._boundaries["right"])
-            )
+        _, start, end, _ = self._seek_swipes[direction]
 
-            if actions_total > 1:
-                self._perform_navigation_full_x(action, start, end, actions_complete)
-            if actions_partial > SWIPE_ACTION_THRESHOLD:
-                self._perform_navigation_partial_x(action, start, end, actions_partial)
-        except (
-            WebDriverException,
-            KeyError,
-            ZeroDivisionError,
-            TypeError,
-            ValueError,
-        ) as e:
-            self._log_and_raise(
-                f"Failed to swipe element into view horizontally: {e}", e
+        if actions_complete > 0:
+            self._perform_navigation_full_x(
+                action, start, end, actions_complete, perform=False
+            )
+        if actions_partial > SWIPE_ACTION_THRESHOLD:
+            # The remainder is a shorter stroke from the same starting bound
+            self._perform_navigation_partial_x(
+                action, start, start, actions_partial if end > start else -actions_partial, perform=False
             )
+        if actions_complete > 0 or actions_partial > SWIPE_ACTION_THRESHOLD:
+            self._perform(action)
+
+    def _perform_navigation(
+        self,
+        action: ActionBuilder,
+        start: tuple[int, int],
+        end: tuple[int, int],
+        iterations: int = 1,
+        perform: bool = True,
+    ) -> None:
+        """
+        Perform full navigation swipes between precomputed endpoints.
+
+        All iterations are queued on the same action sequence and sent in a single request.
+        Pass `perform=False` to queue the swipes without sending them.
+        """
+        for _ in range(iterations):
+            self._perform_swipe(action, start, end)
+        if perform:
+            self._perform(action)
 
     def _perform_navigation_full_y(
         self,
-        action: ActionChains,
+        action: ActionBuilder,
         initial_bound: int,
         final_bound: int,
         iterations: int = 1,
+        perform: bool = True,
     ) -> None:
         """Perform full vertical navigation swipes."""
-        try:
-            for _ in range(iterations):
-                self._perform_swipe(
-                    action,
-                    (self._viewport_x_mid_point, initial_bound),
-                    (self._viewport_x_mid_point, final_bound),
-                )
-                action.perform()
-        except (WebDriverException, AttributeError, ValueError) as e:
-            self._log_and_raise(f"Failed to perform full vertical navigation: {e}", e)
+        self._perform_navigation(
+            action,
+            (self._viewport_x_mid_point, initial_bound),
+            (self._viewport_x_mid_point, final_bound),
+            iterations,
+            perform,
+        )
 
     def _perform_navigation_partial_y(
         self,
-        action: ActionChains,
+        action: ActionBuilder,
         initial_bound: int,
         final_bound: int,
         partial_percentage: int,
+        perform: bool = True,
     ) -> None:
         """Perform a partial vertical navigation swipe."""
-        try:
-            self._perform_swipe(
-                action,
-                (self._viewport_x_mid_point, initial_bound),
-                (self._viewport_x_mid_point, final_bound + partial_percentage),
-            )
-            action.perform()
-        except (WebDriverException, AttributeError, ValueError) as e:
-            self._log_and_raise(
-                f"Failed to perform partial vertical navigation: {e}", e
-            )
+        self._perform_swipe(
+            action,
+            (self._viewport_x_mid_point, initial_bound),
+            (self._viewport_x_mid_point, final_bound + partial_percentage),
+        )
+        if perform:
+            self._perform(action)
 
     def _perform_navigation_full_x(
         self,
-        action: ActionChains,
+        action: ActionBuilder,
         initial_bound: int,
         final_bound: int,
         iterations: int = 1,
+        perform: bool = True,
     ) -> None:
         """Perform full horizontal navigation swipes."""
-        try:
-            for _ in range(iterations):
-                self._perform_swipe(
-                    action,
-                    (initial_bound, self._viewport_y_mid_point),
-                    (final_bound, self._viewport_y_mid_point),
-                )
-                action.perform()
-        except (WebDriverException, AttributeError, ValueError) as e:
-            self._log_and_raise(f"Failed to perform full horizontal navigation: {e}", e)
+        self._perform_navigation(
+            action,
+            (initial_bound, self._viewport_y_mid_point),
+            (final_bound, self._viewport_y_mid_point),
+            iterations,
+            perform,
+        )
 
     def _perform_navigation_partial_x(
         self,
-        action: ActionChains,
+        action: ActionBuilder,
         initial_bound: int,
         final_bound: int,
         partial_percentage: int,
+        perform: bool = True,
     ) -> None:
         """Perform a partial horizontal navigation swipe."""
-        try:
-            self._perform_swipe(
-                action,
-                (initial_bound, self._viewport_y_mid_point),
-                (final_bound + partial_percentage, self._viewport_y_mid_point),
-            )
-            action.perform()
-        except (WebDriverException, AttributeError, ValueError) as e:
-            self._log_and_raise(
-                f"Failed to perform partial horizontal navigation: {e}", e
-            )
-
-    def _perform_navigation_on_element(
-        self,
-        action: ActionChains,
-        initial_bound: tuple[int, int],
-        final_bound: tuple[int, int],
-    ) -> None:
-        """Perform a navigation swipe on a specific element."""
-        try:
-            self._perform_swipe(action, initial_bound, final_bound)
-            action.perform()
-        except (WebDriverException, AttributeError, ValueError) as e:
-            self._log_and_raise(f"Failed to perform navigation on element: {e}", e)
+        self._perform_swipe(
+            action,
+            (initial_bound, self._viewport_y_mid_point),
+            (final_bound + partial_percentage, self._viewport_y_mid_point),
+        )
+        if perform:
+            self._perform(action)
 
     def _perform_swipe(
-        self, action: ActionChains, start: tuple[int, int], end: tuple[int, int]
+        self, action: ActionBuilder, start: tuple[int, int], end: tuple[int, int]
     ) -> None:
         """Perform a swipe action from start to end coordinates."""
-        try:
-            action.w3c_actions.pointer_action.move_to_location(*start)
-            action.w3c_actions.pointer_action.pointer_down()
-            action.w3c_actions.pointer_action.move_to_location(*end)
-            action.w3c_actions.pointer_action.pause(0.5)
-            action.w3c_actions.pointer_action.release()
-        except (WebDriverException, AttributeError, ValueError) as e:
-            self._log_and_raise(f"Failed to perform swipe action: {e}", e)
+        action.pointer_action.move_to_location(*start)
+        action.pointer_action.pointer_down()
+        action.pointer_action.move_to_location(*end)
+        if self._release_pause:
+            action.pointer_action.pause(self._release_pause)
+        action.pointer_action.release()
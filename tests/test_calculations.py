@@ -1,10 +1,31 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
+from selenium.common.exceptions import (
+    StaleElementReferenceException,
+    UnknownMethodException,
+    WebDriverException,
+)
 from selenium.webdriver.remote.webelement import WebElement
 
+from src.interaction.gesture import calculations
 from src.interaction.gesture.calculations import (
+    Boundaries,
+    PointGrid,
+    ScrollableArea,
+    calculate_boundaries,
+    calculate_boundaries_and_scrollable_area,
+    calculate_element_grid,
+    calculate_element_midpoint,
     calculate_element_points,
+    element_rect_cache,
+    invalidate_element_rect_cache,
+    invalidate_viewport_cache,
+    retrieve_display_density,
     retrieve_element_location,
+    retrieve_viewport_dimensions,
 )
+from src.interaction.gesture.enums import Anchor
 
 
 class TestCalculations:
@@ -13,7 +34,7 @@ class TestCalculations:
         """Create a mock WebElement with typical location and size attributes."""
         mock_element = mocker.Mock(spec=WebElement)
         mock_element.location = {"x": 100, "y": 200}
-        mock_element.size = {"width": 50, "height": 75}
+        mock_element.rect = {"x": 100, "y": 200, "width": 50, "height": 75}
         return mock_element
 
     def test_calculate_element_points_default(self, mock_element):
@@ -45,8 +66,7 @@ class TestCalculations:
     def test_calculate_element_points_invalid_dimensions(self, mocker):
         """Test calculate_element_points with invalid element dimensions."""
         invalid_element = mocker.Mock(spec=WebElement)
-        invalid_element.location = {"x": 100, "y": 200}
-        invalid_element.size = {"width": 0, "height": 0}
+        invalid_element.rect = {"x": 100, "y": 200, "width": 0, "height": 0}
 
         with pytest.raises(ValueError, match="Invalid element dimensions"):
             calculate_element_points(invalid_element)
@@ -79,3 +99,163 @@ class TestCalculations:
             assert isinstance(point, tuple)
             assert len(point) == 2
             assert all(isinstance(coord, int) for coord in point)
+
+    def test_calculate_element_grid_default(self, mock_element):
+        """Test calculate_element_grid returns the x and y axes of the element."""
+        grid = calculate_element_grid(mock_element)
+
+        assert grid == PointGrid((100, 125, 150), (200, 237, 275))
+
+    def test_calculate_element_grid_as_tuples(self, mock_element):
+        """Ensure the grid expands to the same points as calculate_element_points."""
+        grid = calculate_element_grid(mock_element, safe_inset=True)
+        points = calculate_element_points(mock_element, safe_inset=True)
+
+        assert grid.as_tuples() == [
+            points["top_left"],
+            points["top_mid"],
+            points["top_right"],
+            points["left_mid"],
+            points["mid"],
+            points["right_mid"],
+            points["bottom_left"],
+            points["bottom_mid"],
+            points["bottom_right"],
+        ]
+
+    def test_calculate_boundaries_and_scrollable_area(self, mocker):
+        """Test boundaries and scrollable area are derived from the viewport and crop factors."""
+        mock_driver = mocker.Mock()
+        mock_driver.get_window_size.return_value = {"width": 1000, "height": 2000}
+
+        boundaries, scrollable_area = calculate_boundaries_and_scrollable_area(
+            mock_driver, upper_cf=0.25
+        )
+
+        assert boundaries == Boundaries(upper=500, lower=1800, left=100, right=900)
+        assert scrollable_area == ScrollableArea(x=800, y=1300)
+
+    def test_calculate_boundaries_from_known_viewport(self):
+        """Test boundaries are scaled from a supplied viewport, and the scrollable area derived from them."""
+        boundaries = calculate_boundaries(1000, 2000)
+
+        assert boundaries == Boundaries(upper=400, lower=1800, left=100, right=900)
+        assert ScrollableArea.from_boundaries(boundaries) == ScrollableArea(x=800, y=1400)
+
+    def test_point_grid_point_matches_as_tuples(self, mock_element):
+        """Test indexing a single anchor agrees with the expanded grid."""
+        grid = calculate_element_grid(mock_element)
+
+        assert grid.point(Anchor.MID) == (125, 237)
+        assert [grid.point(anchor) for anchor in Anchor] == grid.as_tuples()
+
+    def test_element_rect_cache_reuses_reads(self, mocker, mock_element):
+        """Test element geometry is read once within an element_rect_cache block."""
+        rect = mocker.PropertyMock(
+            return_value={"x": 100, "y": 200, "width": 50, "height": 75}
+        )
+        type(mock_element).rect = rect
+
+        with element_rect_cache():
+            calculate_element_points(mock_element)
+            calculate_element_points(mock_element)
+            reads = rect.call_count
+
+            invalidate_element_rect_cache()
+            calculate_element_points(mock_element)
+
+            assert rect.call_count > reads
+
+        calculate_element_points(mock_element)
+        calculate_element_points(mock_element)
+
+        assert calculations._rect_cache.get() is None
+
+    def test_element_rect_cache_local_to_thread(self, mocker, mock_element):
+        """Test other threads neither use nor clear the rects remembered by element_rect_cache."""
+        rect = mocker.PropertyMock(
+            return_value={"x": 100, "y": 200, "width": 50, "height": 75}
+        )
+        type(mock_element).rect = rect
+
+        with element_rect_cache():
+            calculate_element_points(mock_element)
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                executor.submit(invalidate_element_rect_cache).result()
+                executor.submit(calculate_element_points, mock_element).result()
+
+            reads = rect.call_count
+            calculate_element_points(mock_element)
+
+            assert reads == 2
+            assert rect.call_count == reads
+
+    @pytest.mark.parametrize("safe_inset", [True, False])
+    def test_calculate_element_midpoint(self, mock_element, safe_inset):
+        """Test calculate_element_midpoint matches the mid point of calculate_element_points."""
+        assert calculate_element_midpoint(mock_element) == calculate_element_points(
+            mock_element, safe_inset
+        )["mid"]
+
+    def test_retrieve_viewport_dimensions_cached_per_session(self, mocker):
+        """Test viewport dimensions are fetched once per session until invalidated."""
+        mock_driver = mocker.Mock()
+        mock_driver.session_id = "viewport-cache-session"
+        mock_driver.get_window_size.return_value = {"width": 1280, "height": 2856}
+
+        assert retrieve_viewport_dimensions(mock_driver) == (1280, 2856)
+        assert retrieve_viewport_dimensions(mock_driver) == (1280, 2856)
+        mock_driver.get_window_size.assert_called_once()
+
+        mock_driver.get_window_size.return_value = {"width": 2856, "height": 1280}
+        invalidate_viewport_cache(mock_driver)
+
+        assert retrieve_viewport_dimensions(mock_driver) == (2856, 1280)
+
+    @pytest.mark.parametrize("error", [
+        WebDriverException("unknown command"),
+        UnknownMethodException("unknown method exception"),
+    ])
+    def test_calculate_element_points_without_rect(self, mocker, error):
+        """Test element geometry falls back to location and size when rect is unavailable."""
+        element = mocker.Mock(spec=WebElement)
+        type(element).rect = mocker.PropertyMock(side_effect=error)
+        element.location = {"x": 100, "y": 200}
+        element.size = {"width": 50, "height": 75}
+
+        assert calculate_element_points(element)["mid"] == (125, 237)
+
+    def test_calculate_element_points_stale_rect_raises(self, mocker):
+        """Test errors other than a missing rect endpoint are raised rather than retried."""
+        element = mocker.Mock(spec=WebElement)
+        type(element).rect = mocker.PropertyMock(side_effect=StaleElementReferenceException("stale"))
+        location = mocker.PropertyMock()
+        type(element).location = location
+
+        with pytest.raises(StaleElementReferenceException):
+            calculate_element_points(element)
+        location.assert_not_called()
+
+    def test_retrieve_element_location_single_read(self, mocker, mock_element):
+        """Test the element location is read once, or not at all when its rect is cached."""
+        location = mocker.PropertyMock(return_value={"x": 100, "y": 200})
+        type(mock_element).location = location
+
+        assert retrieve_element_location(mock_element) == (100, 200)
+        location.assert_called_once()
+
+        with element_rect_cache():
+            calculate_element_points(mock_element)
+            assert retrieve_element_location(mock_element) == (100, 200)
+
+        location.assert_called_once()
+
+    def test_retrieve_display_density_cached_per_session(self, mocker):
+        """Test the display density is fetched once per session."""
+        mock_driver = mocker.Mock()
+        mock_driver.session_id = "density-cache-session"
+        mock_driver.get_display_density.return_value = 495
+
+        assert retrieve_display_density(mock_driver) == 495
+        assert retrieve_display_density(mock_driver) == 495
+        mock_driver.get_display_density.assert_called_once()
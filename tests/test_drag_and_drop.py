@@ -17,16 +17,14 @@ class TestDragAndDropGestures:
     def mock_source_element(self, mocker):
         """Create a mock source WebElement."""
         mock_element = mocker.Mock(spec=WebElement)
-        mock_element.location = {"x": 100, "y": 200}
-        mock_element.size = {"width": 50, "height": 75}
+        mock_element.rect = {"x": 100, "y": 200, "width": 50, "height": 75}
         return mock_element
 
     @pytest.fixture
     def mock_target_element(self, mocker):
         """Create a mock target WebElement."""
         mock_element = mocker.Mock(spec=WebElement)
-        mock_element.location = {"x": 300, "y": 400}
-        mock_element.size = {"width": 50, "height": 75}
+        mock_element.rect = {"x": 300, "y": 400, "width": 50, "height": 75}
         return mock_element
 
     @pytest.fixture
@@ -58,10 +56,8 @@ class TestDragAndDropGestures:
         """Test drag and drop method specifically for Android platform."""
         mock_execute_script = mocker.patch.object(mock_driver, "execute_script")
 
-        mock_source_element.location = {"x": 125, "y": 237}
-        mock_source_element.size = {"width": 50, "height": 75}
-        mock_target_element.location = {"x": 325, "y": 437}
-        mock_target_element.size = {"width": 50, "height": 75}
+        mock_source_element.rect = {"x": 125, "y": 237, "width": 50, "height": 75}
+        mock_target_element.rect = {"x": 325, "y": 437, "width": 50, "height": 75}
 
         drag_and_drop_gestures_android.drag_and_drop(
             mock_source_element, mock_target_element, speed=1.0
@@ -86,10 +82,8 @@ class TestDragAndDropGestures:
         """Test the drag_and_drop method."""
         mock_execute_script = mocker.patch.object(mock_driver, "execute_script")
 
-        mock_source_element.location = {"x": 125, "y": 237}
-        mock_source_element.size = {"width": 50, "height": 75}
-        mock_target_element.location = {"x": 325, "y": 437}
-        mock_target_element.size = {"width": 50, "height": 75}
+        mock_source_element.rect = {"x": 125, "y": 237, "width": 50, "height": 75}
+        mock_target_element.rect = {"x": 325, "y": 437, "width": 50, "height": 75}
 
         drag_and_drop_gestures_ios.drag_and_drop(
             mock_source_element, mock_target_element, speed=1.5
@@ -2,6 +2,8 @@ import pytest
 from appium.webdriver.webdriver import WebDriver
 from appium.webdriver.webelement import WebElement
 
+from src.interaction.gesture import calculations
+from src.interaction.gesture.calculations import element_rect_cache
 from src.interaction.gesture.exceptions import ZoomError
 from src.interaction.gesture.pinch import PinchGestures, PinchParameters
 
@@ -183,4 +185,16 @@ class TestPinchGestures:
         with pytest.raises(ZoomError, match="Failed to perform pinch open"):
             pinch_gestures.open(mock_element)
         
-        mock_logger.error.assert_called_once()
\ No newline at end of file
+        mock_logger.error.assert_called_once()
+
+    @pytest.mark.parametrize("platform", ["android", "ios"])
+    @pytest.mark.parametrize("gesture", ["open", "close"])
+    def test_pinch_invalidates_rect_cache(self, mock_driver, mock_element, platform, gesture):
+        """Test a pinch clears element rects remembered by element_rect_cache."""
+        pinch_gestures = PinchGestures(mock_driver, platform)
+
+        with element_rect_cache():
+            calculations._rect_cache.get()["element-id"] = (0, 0, 10, 10)
+            getattr(pinch_gestures, gesture)(mock_element)
+
+            assert calculations._rect_cache.get() == {}
@@ -1,7 +1,13 @@
 import pytest
+from appium.webdriver.common.appiumby import AppiumBy
 from appium.webdriver.webdriver import WebDriver
 from appium.webdriver.webelement import WebElement
+from selenium.common.exceptions import NoSuchElementException, WebDriverException
 
+from src.interaction.gesture import calculations
+from src.interaction.gesture.calculations import element_rect_cache
+from src.interaction.gesture.enums import Direction, SeekDirection
+from src.interaction.gesture.exceptions import SwipeError
 from src.interaction.gesture.swipe import SwipeGestures
 
 
@@ -29,6 +35,14 @@ class TestSwipeActions:
         assert swipe_actions._viewport_width == 1280
         assert swipe_actions._viewport_height == 2856
 
+    def test_viewport_supplied(self, mock_driver):
+        """Test a supplied viewport skips the window size query."""
+        swipe_actions = SwipeGestures(mock_driver, "android", viewport=(1080, 2400))
+
+        mock_driver.get_window_size.assert_not_called()
+        assert swipe_actions._viewport_width == 1080
+        assert swipe_actions._viewport_height == 2400
+
     @pytest.mark.parametrize("direction", [
         "up",
         "down",
@@ -45,6 +59,423 @@ class TestSwipeActions:
         
         mock_perform_swipe.assert_called_once()
 
+    @pytest.mark.parametrize("direction,start,end", [
+        ("up", (640, 2570), (640, 571)),
+        ("down", (640, 571), (640, 2570)),
+        ("left", (1152, 1428), (128, 1428)),
+        ("right", (128, 1428), (1152, 1428)),
+        ("previous", (0, 1428), (1280, 1428)),
+        ("next", (1280, 1428), (0, 1428)),
+    ])
+    def test_swipe_endpoints(self, mock_driver, mocker, direction, start, end):
+        """Test full swipes use the endpoints precomputed from the viewport."""
+        swipe_actions = SwipeGestures(mock_driver, "android")
+
+        mock_perform_swipe = mocker.patch.object(swipe_actions, '_perform_swipe', autospec=True)
+
+        getattr(swipe_actions, direction)()
+
+        mock_perform_swipe.assert_called_once_with(mocker.ANY, start, end)
+
+    def test_navigation_iterations_performed_once(self, mock_driver, mocker):
+        """Test repeated swipes are queued and sent in a single request."""
+        swipe_actions = SwipeGestures(mock_driver, "android")
+        action = swipe_actions._create_action()
+
+        spy_perform_swipe = mocker.spy(swipe_actions, '_perform_swipe')
+
+        swipe_actions._perform_navigation_full_y(action, 2570, 571, iterations=3)
+
+        assert spy_perform_swipe.call_count == 3
+        mock_driver.execute.assert_called_once()
+        (pointer,) = mock_driver.execute.call_args.args[1]["actions"]
+        assert [a["type"] for a in pointer["actions"]].count("pointerDown") == 3
+
+    def test_swipe_failure_raises_swipe_error(self, mock_driver):
+        """Test driver errors during a swipe are raised as a SwipeError."""
+        swipe_actions = SwipeGestures(mock_driver, "android")
+        mock_driver.execute.side_effect = WebDriverException("session lost")
+
+        with pytest.raises(SwipeError, match="Failed to swipe up") as exc_info:
+            swipe_actions.up()
+
+        assert exc_info.value.__cause__ is mock_driver.execute.side_effect
+
+    def test_swipe_all_swipes_each_instance(self, mock_driver, mocker):
+        """Test swipe_all performs the swipe on every instance."""
+        instances = [SwipeGestures(mock_driver, "android") for _ in range(3)]
+        mocks = [mocker.patch.object(instance, 'down', autospec=True) for instance in instances]
+
+        SwipeGestures.swipe_all(instances, Direction.DOWN)
+
+        for mock_down in mocks:
+            mock_down.assert_called_once_with()
+
+    def test_swipe_all_string_direction(self, mock_driver, mocker):
+        """Test swipe_all accepts a plain string direction."""
+        instances = [SwipeGestures(mock_driver, "android") for _ in range(2)]
+        mocks = [mocker.patch.object(instance, 'left', autospec=True) for instance in instances]
+
+        SwipeGestures.swipe_all(instances, "left")
+
+        for mock_left in mocks:
+            mock_left.assert_called_once_with()
+
+    def test_swipe_all_invalid_direction(self, mock_driver):
+        """Test swipe_all rejects directions that are not viewport swipes."""
+        with pytest.raises(ValueError, match="Invalid swipe direction"):
+            SwipeGestures.swipe_all([SwipeGestures(mock_driver, "android")], Direction.IN)
+
+    def test_batched_swipes_sent_once(self, mock_driver):
+        """Test swipes made inside batched() are sent together in a single request on exit."""
+        swipe_actions = SwipeGestures(mock_driver, "android")
+
+        with swipe_actions.batched():
+            swipe_actions.up()
+            swipe_actions.left()
+            mock_driver.execute.assert_not_called()
+
+        mock_driver.execute.assert_called_once()
+        payload = mock_driver.execute.call_args.args[1]
+        pointer_actions = payload["actions"][0]["actions"]
+        assert sum(a["type"] == "pointerDown" for a in pointer_actions) == 2
+
+    def test_batched_discards_strokes_on_error(self, mock_driver):
+        """Test strokes queued in a failed batch are discarded and not sent with the next batch."""
+        swipe_actions = SwipeGestures(mock_driver, "android")
+
+        with pytest.raises(RuntimeError), swipe_actions.batched():
+            swipe_actions.up()
+            raise RuntimeError
+
+        assert all(not device.actions for device in swipe_actions._action.devices)
+
+        with swipe_actions.batched():
+            swipe_actions.left()
+
+        payload = mock_driver.execute.call_args.args[1]
+        pointer_actions = payload["actions"][0]["actions"]
+        assert sum(a["type"] == "pointerDown" for a in pointer_actions) == 1
+
+    def test_element_into_view_fallback_rejected_when_batched(self, mock_driver, mocker):
+        """Test the swipe fallback refuses to run inside batched(), where its swipes would not be sent."""
+        swipe_actions = SwipeGestures(mock_driver, "android")
+
+        with pytest.raises(SwipeError, match="batched"), swipe_actions.batched():
+            swipe_actions.element_into_view(value_a="//x", locator_method_a="xpath")
+
+        mock_driver.find_elements.assert_not_called()
+        mock_driver.execute.assert_not_called()
+
+    def test_create_action_reused(self, mock_driver):
+        """Test the action builder is built once and cleared between gestures."""
+        swipe_actions = SwipeGestures(mock_driver, "android")
+
+        action = swipe_actions._create_action()
+        action.pointer_action.pointer_down()
+
+        assert swipe_actions._create_action() is action
+        assert all(not device.actions for device in action.devices)
+
+    def test_release_pause_configurable(self, mock_driver, mocker):
+        """Test the pause before releasing a swipe uses the configured duration."""
+        swipe_actions = SwipeGestures(mock_driver, "android", release_pause=0.1)
+        mock_action = mocker.Mock()
+
+        swipe_actions._perform_swipe(mock_action, (0, 0), (0, 100))
+
+        mock_action.pointer_action.pause.assert_called_once_with(0.1)
+
+    def test_release_pause_disabled(self, mock_driver, mocker):
+        """Test no pause is queued before releasing when the pause is disabled."""
+        swipe_actions = SwipeGestures(mock_driver, "android", release_pause=0)
+        mock_action = mocker.Mock()
+
+        swipe_actions._perform_swipe(mock_action, (0, 0), (0, 100))
+
+        mock_action.pointer_action.pause.assert_not_called()
+        mock_action.pointer_action.release.assert_called_once()
+
 # on_element tests
 
-# element_into_view tests
\ No newline at end of file
+    @pytest.mark.parametrize("direction,start,end", [
+        (Direction.UP, (125, 268), (125, 207)),
+        (Direction.DOWN, (125, 207), (125, 268)),
+        (Direction.LEFT, (145, 237), (105, 237)),
+        (Direction.RIGHT, (105, 237), (145, 237)),
+    ])
+    def test_on_element_endpoints(self, mock_driver, mocker, direction, start, end):
+        """Test swiping on an element uses its inset edge midpoints."""
+        swipe_actions = SwipeGestures(mock_driver, "android")
+        mock_element = mocker.Mock(spec=WebElement)
+        mock_element.rect = {"x": 100, "y": 200, "width": 50, "height": 75}
+
+        mock_perform_swipe = mocker.patch.object(swipe_actions, '_perform_swipe', autospec=True)
+
+        swipe_actions.on_element(mock_element, direction)
+
+        mock_perform_swipe.assert_called_once_with(mocker.ANY, start, end)
+
+# element_into_view tests
+
+    def test_fallback_scroll_lengthens_swipes(self, mock_driver, mocker):
+        """Test each failed probe swipes further than the last."""
+        swipe_actions = SwipeGestures(mock_driver, "android")
+        mock_driver.find_elements.return_value = []
+
+        mock_partial_y = mocker.patch.object(swipe_actions, '_perform_navigation_partial_y', autospec=True)
+
+        assert swipe_actions._fallback_scroll_to_element("value", "xpath", SeekDirection.DOWN) is None
+
+        offsets = [call.args[3] for call in mock_partial_y.call_args_list]
+        assert len(offsets) == swipe_actions._max_attempts
+        assert offsets == sorted(offsets, reverse=True)
+        assert offsets[-1] == 0
+
+    def test_fallback_scroll_max_attempts_configurable(self, mock_driver, mocker):
+        """Test the number of seek swipes follows the configured attempt budget."""
+        swipe_actions = SwipeGestures(mock_driver, "android", max_attempts=3)
+        mock_driver.find_elements.return_value = []
+
+        mock_partial_y = mocker.patch.object(swipe_actions, '_perform_navigation_partial_y', autospec=True)
+
+        assert swipe_actions._fallback_scroll_to_element("value", "xpath", SeekDirection.DOWN) is None
+        assert mock_partial_y.call_count == 3
+
+    def test_fallback_scroll_probes_after_final_swipe(self, mock_driver, mocker):
+        """Test an element revealed by the final seek swipe is still found."""
+        swipe_actions = SwipeGestures(mock_driver, "android", max_attempts=2)
+        mock_element = mocker.Mock(spec=WebElement)
+        mock_element.rect = {"x": 600, "y": 1200, "width": 80, "height": 40}
+        mock_driver.find_elements.side_effect = [[], [], [mock_element]]
+
+        mock_partial_y = mocker.patch.object(swipe_actions, '_perform_navigation_partial_y', autospec=True)
+
+        assert swipe_actions._fallback_scroll_to_element("value", "xpath", SeekDirection.DOWN) is mock_element
+        assert mock_partial_y.call_count == 2
+
+    def test_fallback_scroll_stops_when_end_reached(self, mock_driver, mocker):
+        """Test the search stops swiping once the end of the content is reported."""
+        swipe_actions = SwipeGestures(mock_driver, "android")
+        mock_driver.find_elements.return_value = []
+        end_reached = mocker.Mock(side_effect=[False, True])
+
+        mock_partial_y = mocker.patch.object(swipe_actions, '_perform_navigation_partial_y', autospec=True)
+
+        assert swipe_actions._fallback_scroll_to_element(
+            "value", "xpath", SeekDirection.DOWN, end_reached
+        ) is None
+        assert mock_partial_y.call_count == 2
+
+    def test_fallback_scroll_disables_implicit_wait(self, mock_driver, mocker):
+        """Test probes run without the implicit wait, which is restored afterwards."""
+        swipe_actions = SwipeGestures(mock_driver, "android")
+        mock_driver.timeouts.implicit_wait = 10
+        mock_driver.find_elements.return_value = []
+        mocker.patch.object(swipe_actions, '_perform_navigation_partial_y', autospec=True)
+
+        swipe_actions._fallback_scroll_to_element("value", "xpath", SeekDirection.DOWN)
+
+        assert mock_driver.implicitly_wait.call_args_list == [mocker.call(0), mocker.call(10)]
+
+    def test_implicit_wait_read_once(self, mock_driver, mocker):
+        """Test the session's implicit wait is only read on the first lookup."""
+        swipe_actions = SwipeGestures(mock_driver, "android")
+        mock_timeouts = mocker.PropertyMock(return_value=mocker.Mock(implicit_wait=10))
+        type(mock_driver).timeouts = mock_timeouts
+
+        for _ in range(3):
+            with swipe_actions._no_implicit_wait():
+                pass
+
+        mock_timeouts.assert_called_once()
+        assert mock_driver.implicitly_wait.call_count == 6
+
+    def test_implicit_wait_zero_not_toggled(self, mock_driver):
+        """Test no timeout requests are sent when the implicit wait is already 0."""
+        swipe_actions = SwipeGestures(mock_driver, "android")
+        mock_driver.timeouts.implicit_wait = 0
+
+        with swipe_actions._no_implicit_wait():
+            pass
+
+        mock_driver.implicitly_wait.assert_not_called()
+
+    @pytest.mark.parametrize("platform", ["android", "ios"])
+    def test_element_into_view_returns_fallback_element(self, mock_driver, mocker, platform):
+        """Test the element located by the fallback scroll is returned to the caller."""
+        swipe_actions = SwipeGestures(mock_driver, platform)
+        mock_element = mocker.Mock(spec=WebElement)
+        mock_element.rect = {"x": 600, "y": 1200, "width": 80, "height": 40}
+        mock_driver.find_element.side_effect = NoSuchElementException()
+        mock_driver.find_elements.side_effect = [[], [mock_element]]
+
+        element = swipe_actions.element_into_view(
+            value_a="//x", locator_method_a="xpath", value_i="//x", locator_method_i="xpath"
+        )
+
+        assert element is mock_element
+
+    @pytest.mark.parametrize("element_y,full_swipes,partial", [
+        (2570 + 1999, 1, None),
+        (2570 + 2999, 1, 1000),
+        (2570 + 4098, 2, 100),
+        (2570 + 40, 0, None),
+    ])
+    def test_swipe_element_into_view_vertical_split(self, mock_driver, mocker, element_y, full_swipes, partial):
+        """Test the distance to an element is split into full strokes and a partial remainder."""
+        swipe_actions = SwipeGestures(mock_driver, "android")
+        mock_perform_swipe = mocker.patch.object(swipe_actions, '_perform_swipe', autospec=True)
+        mocker.patch.object(swipe_actions, '_perform', autospec=True)
+
+        swipe_actions._swipe_element_into_view_vertical(mocker.Mock(), element_y, SeekDirection.DOWN)
+
+        expected = [((640, 2570), (640, 571))] * full_swipes
+        if partial is not None:
+            expected.append(((640, 2570), (640, 2570 - partial)))
+        assert [c.args[1:] for c in mock_perform_swipe.call_args_list] == expected
+
+    @pytest.mark.parametrize("element_y,expected", [
+        (320, [((640, 571), (640, 822))]),
+        (571 - 1999 - 300, [((640, 571), (640, 2570)), ((640, 571), (640, 871))]),
+    ])
+    def test_swipe_element_into_view_vertical_up(self, mock_driver, mocker, element_y, expected):
+        """Test seeking up strokes downwards from the upper bound by the distance above it."""
+        swipe_actions = SwipeGestures(mock_driver, "android")
+        mock_perform_swipe = mocker.patch.object(swipe_actions, '_perform_swipe', autospec=True)
+        mocker.patch.object(swipe_actions, '_perform', autospec=True)
+
+        swipe_actions._swipe_element_into_view_vertical(mocker.Mock(), element_y, SeekDirection.UP)
+
+        assert [c.args[1:] for c in mock_perform_swipe.call_args_list] == expected
+
+    @pytest.mark.parametrize("direction,element_x,expected", [
+        (SeekDirection.LEFT, 128 - 1024 - 300, [((128, 1428), (1152, 1428)), ((128, 1428), (428, 1428))]),
+        (SeekDirection.RIGHT, 1152 + 300, [((1152, 1428), (852, 1428))]),
+    ])
+    def test_swipe_element_into_view_horizontal(self, mock_driver, mocker, direction, element_x, expected):
+        """Test horizontal seeks stroke from the seek-side bound by the distance beyond it."""
+        swipe_actions = SwipeGestures(mock_driver, "android")
+        mock_perform_swipe = mocker.patch.object(swipe_actions, '_perform_swipe', autospec=True)
+        mocker.patch.object(swipe_actions, '_perform', autospec=True)
+
+        swipe_actions._swipe_element_into_view_horizontal(mocker.Mock(), element_x, direction)
+
+        assert [c.args[1:] for c in mock_perform_swipe.call_args_list] == expected
+
+    def test_element_into_view_ios_skips_repeat_probe(self, mock_driver, mocker):
+        """Test the iOS fallback swipes first rather than repeating the failed lookup."""
+        swipe_actions = SwipeGestures(mock_driver, "ios", max_attempts=2)
+        mock_driver.find_element.side_effect = NoSuchElementException()
+        mock_driver.find_elements.return_value = []
+        mocker.patch.object(swipe_actions, '_perform_navigation_partial_y', autospec=True)
+
+        assert swipe_actions.element_into_view(value_i="//x", locator_method_i="xpath") is None
+        assert mock_driver.find_element.call_count == 1
+        assert mock_driver.find_elements.call_count == 2
+
+    def test_element_into_view_ios_predicate(self, mock_driver, mocker):
+        """Test iOS predicate locators are found and scrolled to in a single device-side command."""
+        swipe_actions = SwipeGestures(mock_driver, "ios")
+        mock_element = mocker.Mock(spec=WebElement)
+        mock_driver.find_element.return_value = mock_element
+
+        element = swipe_actions.element_into_view(
+            value_i="label == 'Flowers'", locator_method_i=AppiumBy.IOS_PREDICATE
+        )
+
+        assert element is mock_element
+        mock_driver.execute_script.assert_called_once_with(
+            "mobile: scroll", {"predicateString": "label == 'Flowers'"}
+        )
+        mock_driver.implicitly_wait.assert_not_called()
+
+    def test_element_into_view_ios_predicate_falls_back(self, mock_driver, mocker):
+        """Test a failed predicate scroll falls back to swiping for the element."""
+        swipe_actions = SwipeGestures(mock_driver, "ios")
+        mock_driver.execute_script.side_effect = WebDriverException("not found")
+        mock_fallback = mocker.patch.object(swipe_actions, '_fallback_scroll_to_element', autospec=True)
+
+        swipe_actions.element_into_view(
+            value_i="label == 'Flowers'", locator_method_i=AppiumBy.IOS_PREDICATE
+        )
+
+        mock_fallback.assert_called_once()
+
+    def test_element_into_view_android_invalidates_rect_cache(self, mock_driver, mocker):
+        """Test the UiScrollable scroll clears element rects remembered by element_rect_cache."""
+        swipe_actions = SwipeGestures(mock_driver, "android")
+        mock_driver.find_element.return_value = mocker.Mock(spec=WebElement)
+
+        with element_rect_cache():
+            calculations._rect_cache.get()["element-id"] = (0, 0, 10, 10)
+            swipe_actions.element_into_view(
+                value_a='new UiSelector().text("Flowers")', locator_method_a=AppiumBy.ANDROID_UIAUTOMATOR
+            )
+
+            assert calculations._rect_cache.get() == {}
+
+    def test_element_into_view_ios_invalidates_rect_cache(self, mock_driver, mocker):
+        """Test the scrollToElement scroll clears element rects remembered by element_rect_cache."""
+        swipe_actions = SwipeGestures(mock_driver, "ios")
+        mock_driver.find_element.return_value = mocker.Mock(spec=WebElement)
+
+        with element_rect_cache():
+            calculations._rect_cache.get()["element-id"] = (0, 0, 10, 10)
+            swipe_actions.element_into_view(value_i="//x", locator_method_i="xpath")
+
+            assert calculations._rect_cache.get() == {}
+
+    def test_element_into_view_ios_predicate_invalidates_rect_cache(self, mock_driver, mocker):
+        """Test the predicate scroll clears element rects remembered by element_rect_cache."""
+        swipe_actions = SwipeGestures(mock_driver, "ios")
+        mock_driver.find_element.return_value = mocker.Mock(spec=WebElement)
+
+        with element_rect_cache():
+            calculations._rect_cache.get()["element-id"] = (0, 0, 10, 10)
+            swipe_actions.element_into_view(
+                value_i="label == 'Flowers'", locator_method_i=AppiumBy.IOS_PREDICATE
+            )
+
+            assert calculations._rect_cache.get() == {}
+
+    def test_element_into_view_skips_swipe_when_in_bounds(self, mock_driver, mocker):
+        """Test no swipe is made when the located element is already within bounds."""
+        swipe_actions = SwipeGestures(mock_driver, "android")
+        mock_element = mocker.Mock(spec=WebElement)
+        mock_element.rect = {"x": 600, "y": 1200, "width": 80, "height": 40}
+        mock_driver.find_elements.return_value = [mock_element]
+
+        mock_vertical = mocker.patch.object(swipe_actions, '_swipe_element_into_view_vertical')
+
+        element = swipe_actions.element_into_view(value_a="//x", locator_method_a="xpath")
+
+        assert element is mock_element
+        mock_vertical.assert_not_called()
+
+    @pytest.mark.parametrize("direction", ["down", "up", "left", "right"])
+    def test_fallback_scroll_accepts_string_direction(self, mock_driver, mocker, direction):
+        """Test plain string directions are handled like their SeekDirection members."""
+        swipe_actions = SwipeGestures(mock_driver, "android")
+        mock_element = mocker.Mock(spec=WebElement)
+        mock_element.rect = {"x": 600, "y": 1200, "width": 80, "height": 40}
+        mock_driver.find_elements.return_value = [mock_element]
+
+        assert swipe_actions._fallback_scroll_to_element("value", "xpath", direction) is mock_element
+
+    @pytest.mark.parametrize("direction,element_y,start,end", [
+        ("up", 571 - 2999, 571, 2570),
+        ("down", 2570 + 2999, 2570, 571),
+    ])
+    def test_swipe_element_into_view_vertical_string_direction(
+        self, mock_driver, mocker, direction, element_y, start, end
+    ):
+        """Test string directions choose the same stroke as their SeekDirection members."""
+        swipe_actions = SwipeGestures(mock_driver, "android")
+        mock_full_y = mocker.patch.object(swipe_actions, '_perform_navigation_full_y', autospec=True)
+        mocker.patch.object(swipe_actions, '_perform_navigation_partial_y', autospec=True)
+        mocker.patch.object(swipe_actions, '_perform', autospec=True)
+
+        swipe_actions._swipe_element_into_view_vertical(mocker.Mock(), element_y, direction)
+
+        assert mock_full_y.call_args.args[1:3] == (start, end)